@@ -6,6 +6,7 @@ This script demonstrates the capabilities of the MCP server by running
 various examples and showing the results.
 """
 
+import asyncio
 import json
 import sys
 import os
@@ -32,7 +33,7 @@ def demo_server_info():
     
     try:
         from logeion import get_server_info
-        result = get_server_info()
+        result = asyncio.run(get_server_info())
         print_result("get_server_info", {}, result)
         
         print(f"\n✅ Server Status: {result.database_status}")
@@ -51,17 +52,17 @@ def demo_word_search():
         
         # Example 1: Exact match
         print("\n📚 Example 1: Exact word match")
-        result = get_word("amare")
+        result = asyncio.run(get_word("amare"))
         print_result("get_word", {"word": "amare"}, result)
         
         # Example 2: Lemmatization
         print("\n📚 Example 2: Lemmatization (finding base form)")
-        result = get_word("amo")
+        result = asyncio.run(get_word("amo"))
         print_result("get_word", {"word": "amo"}, result)
         
         # Example 3: No results
         print("\n📚 Example 3: Word not found")
-        result = get_word("nonexistentword")
+        result = asyncio.run(get_word("nonexistentword"))
         print_result("get_word", {"word": "nonexistentword"}, result)
         
     except Exception as e:
@@ -74,7 +75,7 @@ def demo_database_exploration():
     try:
         from logeion import explore_database
         
-        result = explore_database("Entries", 3)
+        result = asyncio.run(explore_database("Entries", 3))
         print_result("explore_database", {"table_name": "Entries", "limit": 3}, result)
         
         if result.get("success"):
@@ -95,30 +96,25 @@ def demo_performance():
     print_header("Performance Demo")
     
     try:
-        from logeion import get_word
+        from logeion import get_words
         import time
         
-        # Test multiple word lookups
+        # Look up several words in one batched call
         test_words = ["amare", "puer", "bonus", "magna", "puella"]
         
         print(f"Testing performance with {len(test_words)} words...")
         
-        total_time = 0
-        successful_lookups = 0
+        start_time = time.time()
+        results = asyncio.run(get_words(test_words))
+        total_time = time.time() - start_time
         
-        for word in test_words:
-            start_time = time.time()
-            result = get_word(word)
-            end_time = time.time()
-            
-            lookup_time = end_time - start_time
-            total_time += lookup_time
-            
+        successful_lookups = 0
+        for result in results:
             if result.success:
                 successful_lookups += 1
-                print(f"  ✅ '{word}': {lookup_time:.4f}s")
+                print(f"  ✅ '{result.word}' ({result.method})")
             else:
-                print(f"  ❌ '{word}': {lookup_time:.4f}s (not found)")
+                print(f"  ❌ '{result.word}' (not found)")
         
         avg_time = total_time / len(test_words)
         success_rate = (successful_lookups / len(test_words)) * 100
@@ -146,7 +142,7 @@ def demo_error_handling():
         original_path = logeion.DATABASE_PATH
         logeion.DATABASE_PATH = "/invalid/path/database.sqlite"
         
-        result = get_word("test")
+        result = asyncio.run(get_word("test"))
         print_result("get_word (invalid DB)", {"word": "test"}, result)
         
         # Restore original path
@@ -1,37 +1,626 @@
-from typing import Any, Dict, List, Optional
-import httpx
+from typing import Any, Dict, List, Optional, Set, Tuple
+import asyncio
 from mcp.server.fastmcp import FastMCP
 import sqlite3
-import spacy
+import importlib.util
 import logging
 import os
+import sys
+import threading
+import unicodedata
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+from urllib.request import pathname2url
 from pydantic import BaseModel, Field
 
+# Optional: an in-memory trie over headwords keeps lookups off SQLite
+try:
+    import marisa_trie
+except ImportError:
+    marisa_trie = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 mcp = FastMCP("logeion")
 
+def _reloaded(name: str, default: Any) -> Any:
+    """
+    Return a module global's value from before importlib.reload, or default.
+    
+    Connections, caches, locks and the spaCy model are carried over this
+    way, so a reload neither leaks open connections nor prepares the
+    database or loads the model a second time.
+    """
+    return globals().get(name, default)
+
+if "_connections" in globals():
+    logger.debug("logeion re-imported; reusing its connections, caches and spaCy model")
+
 # Get the directory where this script is located
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DATABASE_PATH = os.path.join(SCRIPT_DIR, "dvlg-wheel-mini.sqlite")
 
-# Load spaCy model once at module level
-try:
-    nlp = spacy.load("la_core_web_lg")
-    logger.info("LatinCy model loaded successfully!")
-except OSError:
-    logger.warning("Warning: LatinCy model not found. Please install it with: python -m spacy download la_core_web_lg")
-    nlp = None
+# The dictionary is static at runtime. After a one-off migration through a
+# short-lived writable connection, lookups use read-only connections opened
+# with immutable=1 (no file locking or change detection) and memory-mapped
+# I/O, so hot pages are read straight from the OS page cache.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA query_only=1",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+)
+# Lookup statements take the projected column list as {columns}
+_LOOKUP_SQL = "SELECT {columns} FROM Entries WHERE head = ?"
+_NORM_LOOKUP_SQL = "SELECT {columns} FROM Entries WHERE head_norm = ?"
+# Batched lookups select the key column first so rows can be bucketed by it
+_BATCH_LOOKUP_SQL = "SELECT {key}, {columns} FROM Entries WHERE {key} IN ({placeholders})"
+# Stay well under SQLite's bound-parameter limit
+_BATCH_SIZE = 500
+# Upper bounds on rows returned per headword and per explore_database call.
+# Rows are pulled from the cursor lazily, so nothing past the cap is read.
+_MAX_RESULT_ROWS = 100
+_MAX_EXPLORE_ROWS = 100
+
+# Schema additions applied to the dictionary the first time it is opened.
+# The index uses the default BINARY collation so `head = ?` can seek on it.
+# Migration is best-effort: on a read-only database it is skipped and
+# lookups fall back to whatever the schema already provides.
+_MIGRATIONS = (
+    "CREATE INDEX IF NOT EXISTS idx_entries_head ON Entries(head)",
+)
+
+# Headwords with diacritics stripped and case folded, so input typed without
+# macrons still hits an index before falling back to the lemmatizer
+_NORM_COLUMN = "head_norm"
+_NORM_MIGRATIONS = (
+    "ALTER TABLE Entries ADD COLUMN head_norm TEXT",
+    "UPDATE Entries SET head_norm = fold(head)",
+    "CREATE INDEX idx_entries_head_norm ON Entries(head_norm)",
+)
+
+# Full-text index over headwords for prefix search. It is an external-content
+# table, so it stores only the index and reads rows back from Entries.
+_FTS_CREATE_SQL = "CREATE VIRTUAL TABLE Entries_fts USING fts5(head, content='Entries')"
+_PREFIX_SQL = (
+    "SELECT {columns} FROM Entries_fts JOIN Entries ON Entries.rowid = Entries_fts.rowid "
+    "WHERE Entries_fts MATCH ? ORDER BY rank LIMIT ?"
+)
+_FTS_TABLE = "Entries_fts"
+# Prefix search on databases that could not be migrated (ASCII case-insensitive only)
+_LIKE_PREFIX_SQL = (
+    "SELECT {columns} FROM Entries WHERE head LIKE ? ESCAPE '\\' "
+    "ORDER BY length(head), head LIMIT ?"
+)
+
+# Seconds the migrating connection waits on a lock held by another server
+# process that is migrating the same file
+_MIGRATION_TIMEOUT = 30.0
+# SQLite error messages meaning the file cannot be written at all (read-only,
+# unable to create a journal, or not permitted), as opposed to busy. Only
+# these skip the migration; immutable readers must never open a file that
+# another process may still be writing.
+_READ_ONLY_ERRORS = (
+    "readonly",
+    "unable to open database file",
+    "access permission denied",
+    "authorization denied",
+)
+
+# Each worker thread keeps one connection per database path, so lookups
+# offloaded from the event loop read in parallel. Every connection opened is
+# also registered per path so it can be closed from any thread, and a
+# thread's connections are closed when the thread ends.
+_local = _reloaded("_local", threading.local())
+_connections: Dict[str, Set[sqlite3.Connection]] = _reloaded("_connections", {})
+# Guards the registries above and the one-time preparation of each database.
+# Reentrant because a finished thread's connections are released from a
+# finalizer, which garbage collection may run while this lock is held.
+_db_lock = _reloaded("_db_lock", threading.RLock())
+# spaCy pipelines are not guaranteed thread-safe, so pipeline runs are serialized
+_nlp_lock = _reloaded("_nlp_lock", threading.Lock())
+
+# Headword -> rowids tries per database path, built when marisa-trie is
+# installed: one over exact headwords for exact lookups, one over normalized
+# headwords for normalized lookups (single and batched) and prefix search
+_head_tries: Dict[str, Any] = _reloaded("_head_tries", {})
+_norm_tries: Dict[str, Any] = _reloaded("_norm_tries", {})
+_ROWID_LOOKUP_SQL = "SELECT {columns} FROM Entries WHERE rowid = ?"
+_ROWIDS_LOOKUP_SQL = "SELECT {columns} FROM Entries WHERE rowid IN ({placeholders}) ORDER BY rowid"
+_KEYED_ROWIDS_LOOKUP_SQL = "SELECT rowid, {columns} FROM Entries WHERE rowid IN ({placeholders})"
+
+# Column names of Entries per database path, used to validate field projections
+_entry_columns: Dict[str, List[str]] = _reloaded("_entry_columns", {})
+
+# Migrated schema objects present per database path (_NORM_COLUMN, _FTS_TABLE)
+_schema_features: Dict[str, Set[str]] = _reloaded("_schema_features", {})
+
+# get_server_info results per database path. Only loading the spaCy model
+# changes them while running, and _load_nlp clears them when it does.
+_server_info: Dict[str, "ServerInfo"] = _reloaded("_server_info", {})
+
+# Tables explore_database may inspect, with their fixed statements. Table
+# names never reach SQL from user input, and the memoized statement text
+# lets sqlite3 reuse the compiled statements across calls. Samples use the
+# lookup projection, so the internal head_norm column stays hidden here too.
+_EXPLORE_SQL = {
+    "Entries": ("PRAGMA table_info(Entries)", "SELECT {columns} FROM Entries LIMIT ?"),
+}
+
+# Actions allowed on connections once the database is prepared
+_READ_ONLY_ACTIONS = {
+    sqlite3.SQLITE_SELECT,
+    sqlite3.SQLITE_READ,
+    sqlite3.SQLITE_FUNCTION,
+    sqlite3.SQLITE_TRANSACTION,
+    sqlite3.SQLITE_RECURSIVE,
+}
+
+# Pipeline components that do not contribute to token lemmas. The tagger,
+# morphologizer and lemmatizers all listen to tok2vec, so those stay.
+_UNUSED_PIPES = ["parser", "ner", "senter"]
+
+# Lemmas by word, least recently used first. _lemma and _lemmas share it, so
+# a word lemmatized in a batch is not lemmatized again on its own. Word
+# frequencies are heavily skewed, so repeat lookups are common.
+_LEMMA_CACHE_SIZE = 131072
+_lemma_cache: "OrderedDict[str, Optional[str]]" = _reloaded("_lemma_cache", OrderedDict())
+_lemma_cache_stats = _reloaded("_lemma_cache_stats", {"hits": 0, "misses": 0})
+_lemma_cache_lock = _reloaded("_lemma_cache_lock", threading.Lock())
+
+# The spaCy model is loaded by _load_nlp on the first lookup that needs a
+# lemma, so servers that never lemmatize never pay for importing spaCy.
+nlp = _reloaded("nlp", None)
+_nlp_loaded = _reloaded("_nlp_loaded", False)
+
+# Lemma lookup table shipped with the model, if any. Probing it is a single
+# hash lookup, so it is tried before running the pipeline.
+_lemma_table = _reloaded("_lemma_table", None)
+
+def _load_nlp() -> Any:
+    """Load the LatinCy model on first use and return it, or None if unavailable."""
+    global nlp, _nlp_loaded, _lemma_table
+    if _nlp_loaded:
+        return nlp
+    with _nlp_lock:
+        if not _nlp_loaded:
+            try:
+                import spacy
+                model = spacy.load("la_core_web_lg", exclude=_UNUSED_PIPES)
+                logger.info("LatinCy model loaded successfully!")
+            except (ImportError, OSError):
+                logger.warning("Warning: LatinCy model not found. Please install it with: python -m spacy download la_core_web_lg")
+                model = None
+            
+            # Table and pipeline lemmas must come from the same model
+            nlp = model
+            if model is not None and model.vocab.lookups.has_table("lemma_lookup"):
+                _lemma_table = model.vocab.lookups.get_table("lemma_lookup")
+            else:
+                _lemma_table = None
+            _nlp_loaded = True
+            # Cached server info still reports the model as not yet loaded
+            _server_info.clear()
+    return nlp
+
+def _fold(text: Optional[str]) -> Optional[str]:
+    """Strip diacritics and case-fold a headword (e.g. "Āmō" -> "amo")."""
+    if text is None:
+        return None
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+def _migrate(conn: sqlite3.Connection) -> None:
+    """Bring the dictionary schema up to date with the indexes lookups rely on."""
+    for statement in _MIGRATIONS:
+        conn.execute(statement)
+    
+    columns = [row["name"] for row in conn.execute("PRAGMA table_info(Entries)")]
+    if _NORM_COLUMN not in columns:
+        conn.create_function("fold", 1, _fold, deterministic=True)
+        conn.execute("BEGIN")
+        try:
+            for statement in _NORM_MIGRATIONS:
+                conn.execute(statement)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    
+    has_fts = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'Entries_fts'"
+    ).fetchone()
+    if not has_fts:
+        # The dictionary is static, so the index is built once and never resynced
+        conn.execute("BEGIN")
+        try:
+            conn.execute(_FTS_CREATE_SQL)
+            conn.execute("INSERT INTO Entries_fts(Entries_fts) VALUES('rebuild')")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
 
-# Pydantic models for better schema documentation
+def _open_connection(path: str) -> sqlite3.Connection:
+    """Open and tune a new read-only connection to the dictionary database."""
+    conn = sqlite3.connect(
+        f"file:{pathname2url(path)}?mode=ro&immutable=1",
+        uri=True,
+        check_same_thread=False,
+        isolation_level=None
+    )
+    conn.row_factory = sqlite3.Row
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+def _migrate_database(path: str) -> None:
+    """
+    Apply migrations through a temporary writable connection, if possible.
+    
+    A database that cannot be written (e.g. mounted read-only) is served as
+    it is; errors opening it surface from the reader. Any other error, such
+    as the lock of another server still migrating, is raised so the next
+    call tries again.
+    """
+    try:
+        # mode=rw refuses to silently create an empty database file
+        conn = sqlite3.connect(
+            f"file:{pathname2url(path)}?mode=rw",
+            uri=True,
+            isolation_level=None,
+            timeout=_MIGRATION_TIMEOUT
+        )
+    except sqlite3.Error:
+        return
+    try:
+        conn.row_factory = sqlite3.Row
+        # immutable readers cannot see a WAL, so keep a rollback journal
+        conn.execute("PRAGMA journal_mode=DELETE")
+        _migrate(conn)
+    except sqlite3.Error as e:
+        if not any(message in str(e) for message in _READ_ONLY_ERRORS):
+            raise
+        logger.warning(f"Could not migrate database {path}, serving it unindexed: {str(e)}")
+    finally:
+        conn.close()
+
+def _build_caches(conn: sqlite3.Connection, path: str) -> None:
+    """Build the per-path lookup caches. Callers hold _db_lock."""
+    if marisa_trie is not None:
+        rows = conn.execute(
+            "SELECT head, rowid FROM Entries WHERE head IS NOT NULL"
+        ).fetchall()
+        _head_tries[path] = marisa_trie.RecordTrie(
+            "<q", [(row[0], (row[1],)) for row in rows]
+        )
+        # Folded here rather than read from head_norm, which an unmigrated
+        # database lacks
+        _norm_tries[path] = marisa_trie.RecordTrie(
+            "<q", [(_fold(row[0]), (row[1],)) for row in rows]
+        )
+    
+    columns = [row["name"] for row in conn.execute("PRAGMA table_info(Entries)")]
+    features = set()
+    if _NORM_COLUMN in columns:
+        features.add(_NORM_COLUMN)
+    if conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (_FTS_TABLE,)).fetchone():
+        features.add(_FTS_TABLE)
+    _schema_features[path] = features
+    # Set last: its presence marks the database as prepared. The normalized
+    # column is internal and never returned to callers.
+    _entry_columns[path] = [name for name in columns if name != _NORM_COLUMN]
+
+def _read_only_authorizer(action: int, arg1: Optional[str], arg2: Optional[str], *_: Any) -> int:
+    """SQLite authorizer that rejects anything that could modify the database."""
+    if action in _READ_ONLY_ACTIONS:
+        return sqlite3.SQLITE_OK
+    # Pragmas may only be queried (no value) or be table_info
+    if action == sqlite3.SQLITE_PRAGMA and (arg2 is None or arg1 == "table_info"):
+        return sqlite3.SQLITE_OK
+    return sqlite3.SQLITE_DENY
+
+def _restrict_to_reads(conn: sqlite3.Connection, path: str) -> None:
+    """Install the read-only authorizer on a freshly opened connection."""
+    # FTS5 connects its virtual table on first use by running internal
+    # schema statements the authorizer would deny, so connect it now
+    if _FTS_TABLE in _schema_features[path]:
+        conn.execute("SELECT 1 FROM Entries_fts LIMIT 0").fetchall()
+    conn.set_authorizer(_read_only_authorizer)
+
+class _ThreadConnections:
+    """A thread's connections by path, closed once the thread's locals are freed."""
+    
+    def __init__(self) -> None:
+        self.by_path: Dict[str, sqlite3.Connection] = {}
+        weakref.finalize(self, _release_connections, self.by_path)
+
+def _release_connections(by_path: Dict[str, sqlite3.Connection]) -> None:
+    """Close and unregister the connections of a thread that has ended."""
+    with _db_lock:
+        for path, conn in by_path.items():
+            registered = _connections.get(path)
+            if registered is not None and conn in registered:
+                registered.discard(conn)
+                conn.close()
+
+def _get_connection() -> sqlite3.Connection:
+    """
+    Return this thread's connection for DATABASE_PATH, opening it on first use.
+    
+    Connections are keyed by path so that reassigning DATABASE_PATH (as the
+    tests do) picks up the new database. The first connection to a path
+    also migrates it and builds its caches. Lookup connections are
+    read-only, and an authorizer additionally restricts them to queries.
+    """
+    path = DATABASE_PATH
+    holder = getattr(_local, "connections", None)
+    if holder is None:
+        holder = _local.connections = _ThreadConnections()
+    local = holder.by_path
+    conn = local.get(path)
+    # A connection closed by _close_connection is no longer registered
+    if conn is not None and conn in _connections.get(path, ()):
+        return conn
+    
+    with _db_lock:
+        prepared = path in _entry_columns
+        if not prepared:
+            _migrate_database(path)
+        conn = _open_connection(path)
+        try:
+            if not prepared:
+                _build_caches(conn, path)
+            _restrict_to_reads(conn, path)
+        except Exception:
+            conn.close()
+            raise
+        _connections.setdefault(path, set()).add(conn)
+    local[path] = conn
+    return conn
+
+def _close_connection(path: str) -> None:
+    """Close every connection to a database path and drop its caches."""
+    with _db_lock:
+        _head_tries.pop(path, None)
+        _norm_tries.pop(path, None)
+        _entry_columns.pop(path, None)
+        _schema_features.pop(path, None)
+        _server_info.pop(path, None)
+        _build_projection.cache_clear()
+        for conn in _connections.pop(path, set()):
+            conn.close()
+
+def _projection(fields: Optional[List[str]]) -> str:
+    """
+    Build the SELECT column list for a lookup, validating requested fields.
+    
+    Callers must have opened a connection to DATABASE_PATH. Field names
+    are checked against the Entries columns before being quoted into SQL.
+    """
+    return _build_projection(DATABASE_PATH, tuple(fields) if fields else ())
+
+@lru_cache(maxsize=256)
+def _build_projection(path: str, fields: Tuple[str, ...]) -> str:
+    """Memoized body of _projection; invalid fields raise and are not cached."""
+    columns = _entry_columns[path]
+    if not fields:
+        fields = tuple(columns)
+    else:
+        unknown = [field for field in fields if field not in columns]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    # Qualified so the list is unambiguous when joined with Entries_fts
+    return ", ".join(f'Entries."{field}"' for field in fields)
+
+@lru_cache(maxsize=256)
+def _statement(template: str, columns: str) -> str:
+    """
+    Format a fixed-shape lookup statement once per projection.
+    
+    Returning the same string object each time also spares sqlite3's
+    statement cache from rehashing the SQL text, since str caches its hash.
+    """
+    return template.format(columns=columns)
+
+def _fetch_rowids(conn: sqlite3.Connection, columns: str, records: List[Tuple[int]]) -> sqlite3.Cursor:
+    """Fetch the rows a trie lookup resolved to, as primary-key reads."""
+    if len(records) == 1:
+        return conn.execute(_statement(_ROWID_LOOKUP_SQL, columns), records[0])
+    rowids = [rowid for rowid, in records]
+    sql = _ROWIDS_LOOKUP_SQL.format(
+        columns=columns, placeholders=",".join("?" * len(rowids))
+    )
+    return conn.execute(sql, rowids)
+
+def _fetch_entries(
+    head: str,
+    fields: Optional[List[str]] = None,
+    *,
+    _get_connection=_get_connection,
+    _projection=_projection,
+    _statement=_statement,
+    _head_tries=_head_tries,
+    _islice=islice,
+) -> List[Dict[str, Any]]:
+    """
+    Run the head lookup on this thread's connection.
+    
+    The keyword-only defaults bind hot module globals as locals, turning a
+    module-dict probe per use into a fast local load. Callers never pass them.
+    """
+    conn = _get_connection()
+    columns = _projection(fields)
+    trie = _head_tries.get(DATABASE_PATH)
+    if trie is None:
+        # sqlite3 keeps the compiled statement in its cache keyed on the SQL text
+        cursor = conn.execute(_statement(_LOOKUP_SQL, columns), (head,))
+        return [dict(row) for row in _islice(cursor, _MAX_RESULT_ROWS)]
+    
+    # The trie answers misses outright; hits become primary-key fetches
+    records = trie.get(head)
+    if records is None:
+        return []
+    return [dict(row) for row in _islice(_fetch_rowids(conn, columns, records), _MAX_RESULT_ROWS)]
+
+def _fetch_normalized(word: str, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """Look up a word against the diacritic- and case-insensitive headwords."""
+    conn = _get_connection()
+    columns = _projection(fields)
+    trie = _norm_tries.get(DATABASE_PATH)
+    if trie is not None:
+        records = trie.get(_fold(word))
+        if records is None:
+            return []
+        cursor = _fetch_rowids(conn, columns, records)
+    elif _NORM_COLUMN in _schema_features[DATABASE_PATH]:
+        cursor = conn.execute(_statement(_NORM_LOOKUP_SQL, columns), (_fold(word),))
+    else:
+        return []
+    return [dict(row) for row in islice(cursor, _MAX_RESULT_ROWS)]
+
+def _fetch_entries_many(
+    heads: List[str], fields: Optional[List[str]] = None, key: str = "head"
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Look up several headwords at once, returning rows grouped by headword.
+    
+    key selects the column matched against: "head", or _NORM_COLUMN for
+    already-folded words.
+    """
+    found: Dict[str, List[Dict[str, Any]]] = {}
+    unique_heads = list(dict.fromkeys(heads))
+    conn = _get_connection()
+    columns = _projection(fields)
+    trie = (_head_tries if key == "head" else _norm_tries).get(DATABASE_PATH)
+    if trie is not None:
+        # Resolve headwords to rowids in memory, so misses never reach SQLite
+        keys_by_rowid = {
+            rowid: head for head in unique_heads for rowid, in trie.get(head, ())
+        }
+        params = sorted(keys_by_rowid)
+    elif key == "head" or key in _schema_features[DATABASE_PATH]:
+        params = unique_heads
+    else:
+        return found
+    
+    # One read transaction for all chunks instead of one per statement
+    conn.execute("BEGIN")
+    try:
+        for start in range(0, len(params), _BATCH_SIZE):
+            chunk = params[start:start + _BATCH_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            if trie is not None:
+                sql = _KEYED_ROWIDS_LOOKUP_SQL.format(columns=columns, placeholders=placeholders)
+            else:
+                sql = _BATCH_LOOKUP_SQL.format(key=key, columns=columns, placeholders=placeholders)
+            cursor = conn.execute(sql, chunk)
+            names = [description[0] for description in cursor.description[1:]]
+            for row in cursor:
+                head = keys_by_rowid[row[0]] if trie is not None else row[0]
+                bucket = found.setdefault(head, [])
+                if len(bucket) < _MAX_RESULT_ROWS:
+                    bucket.append(dict(zip(names, row[1:])))
+    finally:
+        conn.execute("COMMIT")
+    return found
+
+def _cached_lemma(word: str) -> Tuple[bool, Optional[str]]:
+    """Return (found, lemma) for a word from the shared lemma cache."""
+    with _lemma_cache_lock:
+        if word in _lemma_cache:
+            _lemma_cache.move_to_end(word)
+            _lemma_cache_stats["hits"] += 1
+            return True, _lemma_cache[word]
+        _lemma_cache_stats["misses"] += 1
+        return False, None
+
+def _cache_lemma(word: str, lemma: Optional[str]) -> None:
+    """Store a lemma, evicting the least recently used one when full."""
+    with _lemma_cache_lock:
+        _lemma_cache[word] = lemma
+        _lemma_cache.move_to_end(word)
+        if len(_lemma_cache) > _LEMMA_CACHE_SIZE:
+            _lemma_cache.popitem(last=False)
+
+def _lemma_cache_info() -> Dict[str, int]:
+    """Lemma cache statistics, in the shape of functools' cache_info()."""
+    with _lemma_cache_lock:
+        return {
+            **_lemma_cache_stats,
+            "maxsize": _LEMMA_CACHE_SIZE,
+            "currsize": len(_lemma_cache)
+        }
+
+def _lemma_cache_clear() -> None:
+    """Empty the lemma cache and reset its statistics."""
+    with _lemma_cache_lock:
+        _lemma_cache.clear()
+        _lemma_cache_stats.update(hits=0, misses=0)
+
+def _lemma_from_table(word: str) -> Optional[str]:
+    """Probe the model's lemma lookup table, a single hash lookup."""
+    return _lemma_table.get(word) if _lemma_table is not None else None
+
+def _lemma(word: str) -> Optional[str]:
+    """
+    Lemmatize a single word with spaCy, memoizing the result.
+    
+    The model's lookup table is consulted first; the pipeline only runs for
+    words it does not cover. Callers must check that _load_nlp() returned
+    a model.
+    """
+    found, lemma = _cached_lemma(word)
+    if found:
+        return lemma
+    lemma = _lemma_from_table(word)
+    if lemma is None:
+        with _nlp_lock:
+            doc = nlp(word)
+        lemma = doc[0].lemma_ if len(doc) > 0 else None
+    _cache_lemma(word, lemma)
+    return lemma
+
+def _lemmas(words: List[str]) -> Dict[str, Optional[str]]:
+    """
+    Lemmatize several words, batching the ones neither cache covers.
+    
+    Callers must check that _load_nlp() returned a model.
+    """
+    lemmas: Dict[str, Optional[str]] = {}
+    pending = []
+    for word in dict.fromkeys(words):
+        found, lemma = _cached_lemma(word)
+        if not found:
+            lemma = _lemma_from_table(word)
+            if lemma is None:
+                pending.append(word)
+                continue
+            _cache_lemma(word, lemma)
+        lemmas[word] = lemma
+    
+    if pending:
+        with _nlp_lock:
+            docs = list(nlp.pipe(pending, batch_size=64))
+        for word, doc in zip(pending, docs):
+            lemmas[word] = doc[0].lemma_ if len(doc) > 0 else None
+            _cache_lemma(word, lemmas[word])
+    return lemmas
+
+# Pydantic models for better schema documentation.
+# Lookup paths build results with model_construct: every field comes from our
+# own code or SQLite, so per-call validation is skipped. Error paths still
+# use the validating constructor.
 class WordSearchResult(BaseModel):
     success: bool = Field(description="Whether the search was successful")
     word: str = Field(description="The original search term")
     lemma: Optional[str] = Field(description="The lemmatized form if found", default=None)
-    results: Optional[List[Any]] = Field(description="Database results if found", default=None)
-    method: str = Field(description="How the search was performed: exact_match, lemmatized, none, or error")
+    results: Optional[List[Dict[str, Any]]] = Field(description="Database rows if found, keyed by column name", default=None)
+    method: str = Field(description="How the search was performed: exact_match, normalized, lemmatized, prefix, none, or error")
     error: Optional[str] = Field(description="Error message if something went wrong", default=None)
 
 class ServerInfo(BaseModel):
@@ -42,17 +631,88 @@ class ServerInfo(BaseModel):
     database_status: str = Field(description="Database connection status")
     spacy_status: str = Field(description="spaCy model status")
 
+def _lookup_word(
+    word: str,
+    fields: Optional[List[str]] = None,
+    *,
+    _fetch_entries=_fetch_entries,
+    _fetch_normalized=_fetch_normalized,
+    _lemma=_lemma,
+    _load_nlp=_load_nlp,
+    _construct=WordSearchResult.model_construct,
+) -> WordSearchResult:
+    """
+    Synchronous implementation of get_word, run on a worker thread.
+    
+    Hot globals are bound as keyword-only defaults, as in _fetch_entries.
+    """
+    try:
+        # First try to find the word as-is
+        results = _fetch_entries(word, fields)
+        
+        if results:
+            return _construct(
+                success=True,
+                word=word,
+                results=results,
+                method="exact_match"
+            )
+        
+        # Then ignore diacritics and case, which is far cheaper than spaCy
+        results = _fetch_normalized(word, fields)
+        
+        if results:
+            return _construct(
+                success=True,
+                word=word,
+                results=results,
+                method="normalized"
+            )
+        
+        # If no results and spaCy is available, try lemmatization
+        if _load_nlp() is not None:
+            lemma = _lemma(word)
+            if lemma is not None:
+                results = _fetch_entries(lemma, fields)
+                
+                if results:
+                    return _construct(
+                        success=True,
+                        word=word,
+                        lemma=lemma,
+                        results=results,
+                        method="lemmatized"
+                    )
+        
+        return _construct(
+            success=False,
+            word=word,
+            error=f"No results found for '{word}' or its lemma",
+            method="none"
+        )
+    
+    except Exception as e:
+        logger.error(f"Error searching for word '{word}': {str(e)}")
+        return WordSearchResult(
+            success=False,
+            word=word,
+            error=str(e),
+            method="error"
+        )
+
 @mcp.tool()
-def get_word(word: str) -> WordSearchResult:
+async def get_word(word: str, fields: Optional[List[str]] = None) -> WordSearchResult:
     """
     Search for a Latin word in the dictionary database.
     
-    This tool searches for Latin words and automatically attempts lemmatization
-    if the exact word is not found. It connects to a SQLite database containing
+    This tool searches for Latin words, retries ignoring diacritics and case
+    (so "amo" finds "amō"), and then attempts lemmatization if the word is
+    still not found. It connects to a SQLite database containing
     Latin dictionary entries.
     
     Args:
         word: The Latin word to search for (e.g., "amare", "amo", "amamus")
+        fields: Entries columns to return (default: all columns)
         
     Returns:
         A structured result containing the search outcome, including the original
@@ -62,140 +722,303 @@ def get_word(word: str) -> WordSearchResult:
         Search for "amo" (I love) will find the lemma "amare" and return
         dictionary entries for the verb "to love".
     """
-    try: 
-        conn = sqlite3.connect(DATABASE_PATH)
-        cursor = conn.cursor()
+    return await asyncio.to_thread(_lookup_word, word, fields)
+
+def _lookup_words(words: List[str], fields: Optional[List[str]] = None) -> List[WordSearchResult]:
+    """Synchronous implementation of get_words, run on a worker thread."""
+    try:
+        exact = _fetch_entries_many(words, fields)
+        normalized = _fetch_entries_many(
+            [_fold(word) for word in words if word not in exact], fields, key=_NORM_COLUMN
+        )
         
-        try:
-            # First try to find the word as-is
-            cursor.execute("SELECT * FROM Entries WHERE head = ?", (word,))
-            results = cursor.fetchall()
-            
-            if results:
-                return WordSearchResult(
+        # Lemmatize everything that had no exact or normalized match in one batch
+        misses = [
+            word for word in words
+            if word not in exact and _fold(word) not in normalized
+        ]
+        lemmas = _lemmas(misses) if misses and _load_nlp() is not None else {}
+        lemma_hits = _fetch_entries_many(
+            [lemma for lemma in lemmas.values() if lemma is not None], fields
+        ) if lemmas else {}
+        
+        results = []
+        for word in words:
+            if word in exact:
+                results.append(WordSearchResult.model_construct(
                     success=True,
                     word=word,
-                    results=results,
+                    results=exact[word],
                     method="exact_match"
-                )
+                ))
+                continue
             
-            # If no results and spaCy is available, try lemmatization
-            if nlp is not None:
-                doc = nlp(word)
-                if len(doc) > 0:
-                    lemma = doc[0].lemma_
-                    
-                    cursor.execute("SELECT * FROM Entries WHERE head = ?", (lemma,))
-                    results = cursor.fetchall()
-                    
-                    if results:
-                        return WordSearchResult(
-                            success=True,
-                            word=word,
-                            lemma=lemma,
-                            results=results,
-                            method="lemmatized"
-                        )
+            folded = _fold(word)
+            if folded in normalized:
+                results.append(WordSearchResult.model_construct(
+                    success=True,
+                    word=word,
+                    results=normalized[folded],
+                    method="normalized"
+                ))
+                continue
             
-            return WordSearchResult(
+            lemma = lemmas.get(word)
+            if lemma is not None and lemma in lemma_hits:
+                results.append(WordSearchResult.model_construct(
+                    success=True,
+                    word=word,
+                    lemma=lemma,
+                    results=lemma_hits[lemma],
+                    method="lemmatized"
+                ))
+                continue
+            
+            results.append(WordSearchResult.model_construct(
                 success=False,
                 word=word,
                 error=f"No results found for '{word}' or its lemma",
                 method="none"
+            ))
+        return results
+    
+    except Exception as e:
+        logger.error(f"Error searching for words {words}: {str(e)}")
+        return [
+            WordSearchResult(success=False, word=word, error=str(e), method="error")
+            for word in words
+        ]
+
+@mcp.tool()
+async def get_words(words: List[str], fields: Optional[List[str]] = None) -> List[WordSearchResult]:
+    """
+    Search for several Latin words in the dictionary database at once.
+    
+    This behaves like calling get_word for each word, but looks all of them
+    up in a single database query and lemmatizes the misses in one spaCy
+    batch, which is much faster for lists of words.
+    
+    Args:
+        words: The Latin words to search for (e.g., ["amare", "puer", "amo"])
+        fields: Entries columns to return (default: all columns)
+        
+    Returns:
+        One structured result per input word, in the same order.
+    """
+    return await asyncio.to_thread(_lookup_words, words, fields)
+
+def _prefix_from_trie(
+    conn: sqlite3.Connection, trie: Any, prefix: str, limit: int
+) -> List[Dict[str, Any]]:
+    """
+    Resolve a prefix search with one descent of the normalized headword trie.
+    
+    Matches are ordered shortest headword first, then alphabetically, and
+    only the winning rows are fetched from SQLite.
+    """
+    keys = sorted(set(trie.keys(_fold(prefix))), key=lambda key: (len(key), key))
+    rowids = [rowid for key in keys for rowid, in sorted(trie[key])][:limit]
+    if not rowids:
+        return []
+    
+    sql = _KEYED_ROWIDS_LOOKUP_SQL.format(
+        columns=_projection(None), placeholders=",".join("?" * len(rowids))
+    )
+    rows = {row[0]: row for row in conn.execute(sql, rowids)}
+    names = list(rows[rowids[0]].keys())[1:]
+    return [dict(zip(names, tuple(rows[rowid])[1:])) for rowid in rowids]
+
+def _lookup_prefix(prefix: str, limit: int = 20) -> WordSearchResult:
+    """Synchronous implementation of get_word_prefix, run on a worker thread."""
+    prefix = prefix.strip()
+    if not prefix:
+        return WordSearchResult(
+            success=False,
+            word=prefix,
+            error="Prefix must not be empty",
+            method="error"
+        )
+    
+    try:
+        conn = _get_connection()
+        limit = max(0, min(limit, _MAX_RESULT_ROWS))
+        trie = _norm_tries.get(DATABASE_PATH)
+        if trie is not None:
+            results = _prefix_from_trie(conn, trie, prefix, limit)
+        elif _FTS_TABLE in _schema_features[DATABASE_PATH]:
+            # Quote the prefix so FTS5 treats it as a literal string, then
+            # prefix-match it against the first token of the headword only
+            query = '^"' + prefix.replace('"', '""') + '"*'
+            cursor = conn.execute(_statement(_PREFIX_SQL, _projection(None)), (query, limit))
+            results = [dict(row) for row in cursor]
+        else:
+            # Unmigrated database: escape LIKE wildcards and scan the headwords
+            pattern = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            cursor = conn.execute(_statement(_LIKE_PREFIX_SQL, _projection(None)), (pattern, limit))
+            results = [dict(row) for row in cursor]
+        
+        if results:
+            return WordSearchResult.model_construct(
+                success=True,
+                word=prefix,
+                results=results,
+                method="prefix"
             )
-            
-        finally:
-            conn.close()  # Always closes, even if error
+        
+        return WordSearchResult.model_construct(
+            success=False,
+            word=prefix,
+            error=f"No entries found starting with '{prefix}'",
+            method="none"
+        )
     
     except Exception as e:
-        logger.error(f"Error searching for word '{word}': {str(e)}")
+        logger.error(f"Error searching for prefix '{prefix}': {str(e)}")
         return WordSearchResult(
             success=False,
-            word=word,
+            word=prefix,
             error=str(e),
             method="error"
         )
 
 @mcp.tool()
-def get_server_info() -> ServerInfo:
+async def get_word_prefix(prefix: str, limit: int = 20) -> WordSearchResult:
     """
-    Get information about the Logeion MCP server.
+    Search for Latin dictionary entries whose headword starts with a prefix.
     
-    This tool provides metadata about the server, including its capabilities,
-    current status, and available tools. Useful for server inspection and
-    health checking.
+    Matching is case- and diacritic-insensitive. With marisa-trie installed it
+    walks an in-memory trie of headwords and returns the shortest matches
+    first; otherwise it uses a full-text index and ranks by relevance.
     
+    Args:
+        prefix: The beginning of the Latin word (e.g., "am", "pue")
+        limit: Maximum number of entries to return (default: 20, at most 100)
+        
     Returns:
-        Server information including name, version, description, available tools,
-        database status, and spaCy model status.
+        A structured result containing the matching database entries.
+        
+    Example:
+        Searching for "pue" returns entries such as "puer" and "puella".
     """
+    return await asyncio.to_thread(_lookup_prefix, prefix, limit)
+
+def _get_server_info() -> ServerInfo:
+    """Synchronous implementation of get_server_info, run on a worker thread."""
+    info = _server_info.get(DATABASE_PATH)
+    if info is not None:
+        return info
+    
     # Check database status
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
-        conn.close()
+        _get_connection().execute("SELECT 1")
         db_status = "connected"
     except Exception as e:
         db_status = f"error: {str(e)}"
     
-    # Check spaCy status
+    # Check spaCy status without forcing the model to load
     if nlp is not None:
         spacy_status = "loaded (la_core_web_lg)"
+    elif not _nlp_loaded and importlib.util.find_spec("la_core_web_lg") is not None:
+        spacy_status = "available (la_core_web_lg, loaded on first lemma lookup)"
     else:
         spacy_status = "not available"
     
-    return ServerInfo(
+    info = ServerInfo(
         name="Logeion MCP Server",
         version="1.0.0",
         description="A powerful Latin dictionary MCP server with lemmatization support",
-        tools_available=["get_word", "get_server_info", "explore_database"],
+        tools_available=["get_word", "get_words", "get_word_prefix", "get_server_info", "ping", "explore_database"],
         database_status=db_status,
         spacy_status=spacy_status
     )
+    # Errors are not cached so a database that appears later is picked up
+    if db_status == "connected":
+        _server_info[DATABASE_PATH] = info
+    return info
 
 @mcp.tool()
-def explore_database(table_name: str = "Entries", limit: int = 10) -> Dict[str, Any]:
+async def get_server_info() -> ServerInfo:
     """
-    Explore the database structure and sample data.
+    Get information about the Logeion MCP server.
     
-    This tool allows inspection of the database schema and provides sample
-    data for understanding the available information. Useful for development
-    and debugging.
+    This tool provides metadata about the server, including its capabilities,
+    current status, and available tools. Useful for server inspection. The
+    information is computed once per database; use ping for a live check.
     
-    Args:
-        table_name: The table to explore (default: "Entries")
-        limit: Maximum number of sample rows to return (default: 10)
-        
     Returns:
-        Database schema information and sample data.
+        Server information including name, version, description, available tools,
+        database status, and spaCy model status.
+    """
+    return await asyncio.to_thread(_get_server_info)
+
+def _ping() -> Dict[str, Any]:
+    """Synchronous implementation of ping, run on a worker thread."""
+    try:
+        _get_connection().execute("SELECT 1")
+        return {
+            "success": True,
+            "database_status": "connected",
+            "lemma_cache": _lemma_cache_info()
+        }
+    
+    except Exception as e:
+        logger.error(f"Error pinging database: {str(e)}")
+        return {
+            "success": False,
+            "database_status": f"error: {str(e)}"
+        }
+
+@mcp.tool()
+async def ping() -> Dict[str, Any]:
     """
+    Check that the server can still reach its database.
+    
+    Unlike get_server_info, this runs a query on every call, and it also
+    reports lemma cache statistics.
+    
+    Returns:
+        Liveness status, database status, and lemma cache statistics.
+    """
+    return await asyncio.to_thread(_ping)
+
+def _explore_database(table_name: str, limit: int) -> Dict[str, Any]:
+    """Synchronous implementation of explore_database, run on a worker thread."""
+    statements = _EXPLORE_SQL.get(table_name)
+    if statements is None:
+        return {
+            "success": False,
+            "error": f"Unknown table '{table_name}'. Available tables: {', '.join(_EXPLORE_SQL)}",
+            "table": table_name
+        }
+    schema_sql, sample_sql = statements
+    
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
-        cursor = conn.cursor()
+        conn = _get_connection()
+        
+        # Get table schema
+        schema = [
+            tuple(row) for row in conn.execute(schema_sql)
+            if row["name"] != _NORM_COLUMN
+        ]
+        
+        # Get sample data
+        # A negative LIMIT means "no limit" to SQLite, so clamp both ends
+        limit = max(0, min(limit, _MAX_EXPLORE_ROWS))
+        cursor = conn.execute(_statement(sample_sql, _projection(None)), (limit,))
+        sample_data = [tuple(row) for row in cursor]
+        
+        # Get column names
+        column_names = [desc[0] for desc in cursor.description] if cursor.description else []
+        
+        return {
+            "success": True,
+            "table": table_name,
+            "schema": schema,
+            "column_names": column_names,
+            "sample_data": sample_data,
+            "total_rows": len(sample_data)
+        }
         
-        try:
-            # Get table schema
-            cursor.execute(f"PRAGMA table_info({table_name})")
-            schema = cursor.fetchall()
-            
-            # Get sample data
-            cursor.execute(f"SELECT * FROM {table_name} LIMIT ?", (limit,))
-            sample_data = cursor.fetchall()
-            
-            # Get column names
-            column_names = [desc[0] for desc in cursor.description] if cursor.description else []
-            
-            return {
-                "success": True,
-                "table": table_name,
-                "schema": schema,
-                "column_names": column_names,
-                "sample_data": sample_data,
-                "total_rows": len(sample_data)
-            }
-            
-        finally:
-            conn.close()
-            
     except Exception as e:
         logger.error(f"Error exploring database: {str(e)}")
         return {
@@ -204,9 +1027,32 @@ def explore_database(table_name: str = "Entries", limit: int = 10) -> Dict[str,
             "table": table_name
         }
 
+@mcp.tool()
+async def explore_database(table_name: str = "Entries", limit: int = 10) -> Dict[str, Any]:
+    """
+    Explore the database structure and sample data.
+    
+    This tool allows inspection of the database schema and provides sample
+    data for understanding the available information. Useful for development
+    and debugging.
+    
+    Args:
+        table_name: The table to explore; only "Entries" is available (default: "Entries")
+        limit: Maximum number of sample rows to return (default: 10, at most 100)
+        
+    Returns:
+        Database schema information and sample data.
+    """
+    return await asyncio.to_thread(_explore_database, table_name, limit)
+
 if __name__ == "__main__":
+    # Register this module under its import name so that `import logeion`
+    # from inside the running server reuses it instead of loading a second
+    # copy with its own model and connections
+    sys.modules.setdefault("logeion", sys.modules[__name__])
+    
     logger.info("Starting Logeion MCP Server...")
     logger.info(f"Database path: {DATABASE_PATH}")
-    logger.info(f"spaCy model loaded: {nlp is not None}")
+    logger.info("spaCy model will load on the first lemma lookup")
     mcp.run(transport='stdio')
 
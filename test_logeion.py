@@ -10,6 +10,7 @@ This test suite covers:
 - Performance testing
 """
 
+import asyncio
 import unittest
 import sqlite3
 import tempfile
@@ -21,7 +22,12 @@ import json
 # Add the current directory to the path so we can import logeion
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from logeion import get_word, get_server_info, explore_database, WordSearchResult, ServerInfo
+from logeion import get_word, get_words, get_word_prefix, get_server_info, ping, explore_database, WordSearchResult, ServerInfo
+
+try:
+    import marisa_trie
+except ImportError:
+    marisa_trie = None
 
 class TestLogeionMCPServer(unittest.TestCase):
     """Test cases for the Logeion MCP Server."""
@@ -35,6 +41,16 @@ class TestLogeionMCPServer(unittest.TestCase):
         # Create test database with sample data
         self.create_test_database()
         
+        # Start each test with an empty lemma cache
+        sys.modules['logeion']._lemma_cache_clear()
+        
+        # Never load a real spaCy model or its lemma table; tests that need
+        # either patch in their own
+        for name, value in (('_nlp_loaded', True), ('_lemma_table', None)):
+            patcher = patch(f'logeion.{name}', value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        
         # Store original database path
         self.original_db_path = None
         if hasattr(sys.modules['logeion'], 'DATABASE_PATH'):
@@ -46,24 +62,33 @@ class TestLogeionMCPServer(unittest.TestCase):
         if self.original_db_path:
             sys.modules['logeion'].DATABASE_PATH = self.original_db_path
         
+        # Close the shared connections before the file is removed
+        sys.modules['logeion']._close_connection(self.temp_db.name)
+        
         # Remove temporary database
         if os.path.exists(self.temp_db.name):
             os.unlink(self.temp_db.name)
     
     def create_test_database(self):
         """Create a test database with sample Latin words."""
-        conn = sqlite3.connect(self.temp_db.name)
+        conn = sqlite3.connect(self.temp_db.name, isolation_level=None)
         cursor = conn.cursor()
         
-        # Create Entries table
-        cursor.execute('''
+        # The database is throwaway, so skip journaling and fsyncs
+        cursor.execute('PRAGMA journal_mode=MEMORY')
+        cursor.execute('PRAGMA synchronous=OFF')
+        
+        # Create Entries table inside one transaction that also covers the inserts
+        cursor.executescript('''
+            BEGIN;
             CREATE TABLE Entries (
                 id INTEGER PRIMARY KEY,
                 head TEXT NOT NULL,
                 definition TEXT,
                 part_of_speech TEXT,
                 etymology TEXT
-            )
+            );
+            CREATE INDEX idx_entries_head ON Entries(head);
         ''')
         
         # Insert sample data
@@ -74,7 +99,9 @@ class TestLogeionMCPServer(unittest.TestCase):
             ('puer', 'boy', 'noun', 'from Proto-Indo-European *ph₂wḗr'),
             ('puella', 'girl', 'noun', 'diminutive of puer'),
             ('bonus', 'good', 'adjective', 'from Proto-Indo-European *dʰew-'),
-            ('magna', 'great', 'adjective', 'feminine singular of magnus')
+            ('magna', 'great', 'adjective', 'feminine singular of magnus'),
+            ('cūra', 'care', 'noun', 'from Old Latin coira'),
+            ('de puero', 'about the boy', 'phrase', 'de with the ablative of puer')
         ]
         
         cursor.executemany(
@@ -82,7 +109,7 @@ class TestLogeionMCPServer(unittest.TestCase):
             sample_data
         )
         
-        conn.commit()
+        cursor.execute('COMMIT')
         conn.close()
     
     def test_get_word_exact_match(self):
@@ -90,7 +117,7 @@ class TestLogeionMCPServer(unittest.TestCase):
         # Temporarily set the database path to our test database
         sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
         
-        result = get_word("amare")
+        result = asyncio.run(get_word("amare"))
         
         self.assertIsInstance(result, WordSearchResult)
         self.assertTrue(result.success)
@@ -98,7 +125,39 @@ class TestLogeionMCPServer(unittest.TestCase):
         self.assertEqual(result.method, "exact_match")
         self.assertIsNotNone(result.results)
         self.assertEqual(len(result.results), 1)
-        self.assertEqual(result.results[0][1], "amare")  # head column
+        self.assertEqual(result.results[0]["head"], "amare")
+    
+    def test_get_word_fields(self):
+        """Test that only the requested fields are returned."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        result = asyncio.run(get_word("amare", fields=["head", "definition"]))
+        
+        self.assertTrue(result.success)
+        self.assertEqual(result.results, [{"head": "amare", "definition": "to love"}])
+    
+    def test_get_word_unknown_field(self):
+        """Test that unknown fields are rejected instead of reaching SQL."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        result = asyncio.run(get_word("amare", fields=["head; DROP TABLE Entries"]))
+        
+        self.assertFalse(result.success)
+        self.assertEqual(result.method, "error")
+        self.assertIn("Unknown fields", result.error)
+    
+    def test_get_word_normalized(self):
+        """Test that diacritics and case are ignored before lemmatizing."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        with patch('logeion.nlp') as mock_nlp:
+            result = asyncio.run(get_word("Cura"))
+            
+            self.assertTrue(result.success)
+            self.assertEqual(result.method, "normalized")
+            self.assertEqual(result.results[0]["head"], "cūra")
+            self.assertNotIn("head_norm", result.results[0])
+            mock_nlp.assert_not_called()
     
     def test_get_word_lemmatization(self):
         """Test word lemmatization when exact match not found."""
@@ -112,7 +171,7 @@ class TestLogeionMCPServer(unittest.TestCase):
             mock_doc.__len__.return_value = 1
             mock_nlp.return_value = mock_doc
             
-            result = get_word("amo")
+            result = asyncio.run(get_word("amo"))
             
             self.assertIsInstance(result, WordSearchResult)
             self.assertTrue(result.success)
@@ -121,12 +180,41 @@ class TestLogeionMCPServer(unittest.TestCase):
             self.assertEqual(result.method, "lemmatized")
             self.assertIsNotNone(result.results)
     
+    def test_get_word_lemma_cached(self):
+        """Test that repeated misses reuse the cached lemma."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        with patch('logeion.nlp') as mock_nlp:
+            mock_doc = MagicMock()
+            mock_doc.__getitem__.return_value.lemma_ = "amare"
+            mock_doc.__len__.return_value = 1
+            mock_nlp.return_value = mock_doc
+            
+            first = asyncio.run(get_word("amavit"))
+            second = asyncio.run(get_word("amavit"))
+            
+            self.assertEqual(first.method, "lemmatized")
+            self.assertEqual(second.lemma, "amare")
+            mock_nlp.assert_called_once_with("amavit")
+    
+    def test_get_word_lemma_table(self):
+        """Test that the lemma lookup table is used before the pipeline."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        with patch('logeion.nlp') as mock_nlp, \
+                patch('logeion._lemma_table', {"pueri": "puer"}):
+            result = asyncio.run(get_word("pueri"))
+            
+            self.assertEqual(result.method, "lemmatized")
+            self.assertEqual(result.lemma, "puer")
+            mock_nlp.assert_not_called()
+    
     def test_get_word_no_results(self):
         """Test behavior when no results are found."""
         # Temporarily set the database path to our test database
         sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
         
-        result = get_word("nonexistentword")
+        result = asyncio.run(get_word("nonexistentword"))
         
         self.assertIsInstance(result, WordSearchResult)
         self.assertFalse(result.success)
@@ -139,34 +227,301 @@ class TestLogeionMCPServer(unittest.TestCase):
         # Set an invalid database path
         sys.modules['logeion'].DATABASE_PATH = "/invalid/path/database.sqlite"
         
-        result = get_word("test")
+        result = asyncio.run(get_word("test"))
         
         self.assertIsInstance(result, WordSearchResult)
         self.assertFalse(result.success)
         self.assertEqual(result.method, "error")
         self.assertIsNotNone(result.error)
     
+    def test_get_words(self):
+        """Test batched lookup of several words."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        with patch('logeion.nlp') as mock_nlp:
+            mock_doc = MagicMock()
+            mock_doc.__getitem__.return_value.lemma_ = "amare"
+            mock_doc.__len__.return_value = 1
+            mock_nlp.pipe.return_value = [mock_doc]
+            
+            results = asyncio.run(get_words(["puer", "amavit", "puer", "cura"]))
+            
+            self.assertEqual([r.word for r in results], ["puer", "amavit", "puer", "cura"])
+            self.assertEqual(results[0].method, "exact_match")
+            self.assertEqual(results[0].results[0]["head"], "puer")
+            self.assertEqual(results[1].method, "lemmatized")
+            self.assertEqual(results[1].lemma, "amare")
+            self.assertEqual(results[2].method, "exact_match")
+            self.assertEqual(results[3].method, "normalized")
+            mock_nlp.pipe.assert_called_once()
+            mock_nlp.assert_not_called()
+    
+    def test_get_words_shares_lemma_cache(self):
+        """Test that single and batched lookups reuse each other's lemmas."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        with patch('logeion.nlp') as mock_nlp:
+            mock_doc = MagicMock()
+            mock_doc.__getitem__.return_value.lemma_ = "amare"
+            mock_doc.__len__.return_value = 1
+            mock_nlp.return_value = mock_doc
+            mock_nlp.pipe.side_effect = lambda words, **kwargs: [mock_doc for _ in words]
+        
+            asyncio.run(get_word("amavit"))
+            batched = asyncio.run(get_words(["amavit", "amaverunt"]))
+            single = asyncio.run(get_word("amaverunt"))
+        
+            self.assertEqual([r.lemma for r in batched], ["amare", "amare"])
+            self.assertEqual(single.lemma, "amare")
+            mock_nlp.assert_called_once_with("amavit")
+            self.assertEqual(list(mock_nlp.pipe.call_args[0][0]), ["amaverunt"])
+            mock_nlp.pipe.assert_called_once()
+    
+    def test_get_word_concurrent(self):
+        """Test that concurrent lookups each get a result."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        async def lookup_all():
+            return await asyncio.gather(*(get_word(w) for w in ["amare", "puer", "bonus", "magna"]))
+        
+        results = asyncio.run(lookup_all())
+        
+        self.assertEqual([r.results[0]["head"] for r in results], ["amare", "puer", "bonus", "magna"])
+    
+    def test_get_words_database_error(self):
+        """Test that a failed batch reports an error for every word."""
+        sys.modules['logeion'].DATABASE_PATH = "/invalid/path/database.sqlite"
+        
+        results = asyncio.run(get_words(["amare", "puer"]))
+        
+        self.assertEqual(len(results), 2)
+        self.assertTrue(all(r.method == "error" for r in results))
+    
+    def test_get_word_prefix(self):
+        """Test prefix search over headwords."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        result = asyncio.run(get_word_prefix("pue"))
+        
+        self.assertIsInstance(result, WordSearchResult)
+        self.assertTrue(result.success)
+        self.assertEqual(result.method, "prefix")
+        self.assertEqual(sorted(row["head"] for row in result.results), ["puella", "puer"])
+    
+    def test_get_word_prefix_ignores_case_and_diacritics(self):
+        """Test that prefix search folds case and diacritics."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        result = asyncio.run(get_word_prefix("CU"))
+        
+        self.assertTrue(result.success)
+        self.assertEqual([row["head"] for row in result.results], ["cūra"])
+    
+    @unittest.skipIf(marisa_trie is None, "marisa-trie not installed")
+    def test_get_word_prefix_uses_trie(self):
+        """Test that prefix search orders trie matches shortest first."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        result = asyncio.run(get_word_prefix("am", limit=2))
+        
+        self.assertEqual([row["head"] for row in result.results], ["amo", "amare"])
+    
+    def test_get_word_prefix_full_text_index(self):
+        """Test prefix search through FTS5 on a read-only connection."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        # Prepare the database first, or its trie would be built inside the patch
+        asyncio.run(get_word("puer"))
+        with patch.dict('logeion._norm_tries', clear=True):
+            result = asyncio.run(get_word_prefix("pue"))
+        
+        self.assertTrue(result.success)
+        # "de puero" has a token starting with "pue", but the headword does not
+        self.assertEqual(sorted(row["head"] for row in result.results), ["puella", "puer"])
+    
+    def test_get_word_prefix_no_results(self):
+        """Test prefix search when nothing matches."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        result = asyncio.run(get_word_prefix("xyz"))
+        
+        self.assertFalse(result.success)
+        self.assertEqual(result.method, "none")
+    
     def test_get_server_info(self):
         """Test server information retrieval."""
         # Temporarily set the database path to our test database
         sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
         
-        result = get_server_info()
+        result = asyncio.run(get_server_info())
         
         self.assertIsInstance(result, ServerInfo)
         self.assertEqual(result.name, "Logeion MCP Server")
         self.assertEqual(result.version, "1.0.0")
         self.assertIn("get_word", result.tools_available)
+        self.assertIn("get_words", result.tools_available)
+        self.assertIn("get_word_prefix", result.tools_available)
         self.assertIn("get_server_info", result.tools_available)
+        self.assertIn("ping", result.tools_available)
         self.assertIn("explore_database", result.tools_available)
         self.assertEqual(result.database_status, "connected")
     
+    def test_get_server_info_cached(self):
+        """Test that server information is computed once per database."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        self.assertIs(asyncio.run(get_server_info()), asyncio.run(get_server_info()))
+    
+    def test_get_server_info_after_model_load(self):
+        """Test that loading the spaCy model refreshes the cached status."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        # A stand-in spaCy module, so the real package and model are never loaded
+        model = MagicMock()
+        model.vocab.lookups.has_table.return_value = False
+        fake_spacy = MagicMock()
+        fake_spacy.load.return_value = model
+        
+        first = asyncio.run(get_server_info())
+        with patch('logeion._nlp_loaded', False), patch('logeion.nlp', None), \
+                patch.dict(sys.modules, {'spacy': fake_spacy}):
+            self.assertIs(sys.modules['logeion']._load_nlp(), model)
+            second = asyncio.run(get_server_info())
+        
+        self.assertIsNot(first, second)
+        self.assertEqual(second.spacy_status, "loaded (la_core_web_lg)")
+    
+    def test_ping(self):
+        """Test the live database check."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        result = asyncio.run(ping())
+        
+        self.assertTrue(result["success"])
+        self.assertEqual(result["database_status"], "connected")
+        self.assertIn("hits", result["lemma_cache"])
+    
+    def test_ping_database_error(self):
+        """Test the live database check against a missing database."""
+        sys.modules['logeion'].DATABASE_PATH = "/invalid/path/database.sqlite"
+        
+        result = asyncio.run(ping())
+        
+        self.assertFalse(result["success"])
+        self.assertTrue(result["database_status"].startswith("error"))
+    
+    def test_get_word_reuses_connection(self):
+        """Test that repeated lookups on one thread share a database connection."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        sys.modules['logeion']._lookup_word("amare")
+        sys.modules['logeion']._lookup_word("puer")
+        
+        connections = sys.modules['logeion']._connections[self.temp_db.name]
+        self.assertEqual(len(connections), 1)
+        conn = next(iter(connections))
+        self.assertEqual(conn.execute("PRAGMA query_only").fetchone()[0], 1)
+        self.assertGreater(conn.execute("PRAGMA mmap_size").fetchone()[0], 0)
+    
+    def test_worker_thread_connections_closed(self):
+        """Test that connections opened by finished worker threads are closed."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        for _ in range(5):
+            # Each asyncio.run shuts down its own default executor and threads
+            asyncio.run(get_word("amare"))
+        
+        self.assertEqual(len(sys.modules['logeion']._connections[self.temp_db.name]), 0)
+    
+    @unittest.skipIf(marisa_trie is None, "marisa-trie not installed")
+    def test_head_trie(self):
+        """Test that misses are answered by the headword trie without SQL."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        # Open this thread's connection, which the traced lookup below reuses
+        result = sys.modules['logeion']._lookup_word("puer")
+        self.assertEqual(result.results[0]["head"], "puer")
+        trie = sys.modules['logeion']._head_tries[self.temp_db.name]
+        self.assertIn("puella", trie)
+        
+        statements = []
+        connections = sys.modules['logeion']._connections[self.temp_db.name]
+        self.assertEqual(len(connections), 1)
+        next(iter(connections)).set_trace_callback(statements.append)
+        result = sys.modules['logeion']._lookup_word("nonexistentword")
+        
+        self.assertEqual(result.method, "none")
+        self.assertEqual(statements, [])
+    
+    def test_head_lookup_uses_index(self):
+        """Test that the head lookup is an index seek, not a table scan."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        # Look up on this thread; worker threads close their connections on exit
+        sys.modules['logeion']._lookup_word("amare")
+        conn = next(iter(sys.modules['logeion']._connections[self.temp_db.name]))
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN " + sys.modules['logeion']._LOOKUP_SQL.format(columns="*"),
+            ("amare",)
+        ).fetchall()
+        
+        self.assertIn("USING INDEX idx_entries_head", plan[0][-1])
+    
+    def test_migration_creates_head_index(self):
+        """Test that opening a database without the head index adds it."""
+        conn = sqlite3.connect(self.temp_db.name)
+        conn.execute("DROP INDEX idx_entries_head")
+        conn.close()
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        asyncio.run(get_word("amare"))
+        
+        conn = sqlite3.connect(self.temp_db.name)
+        indexes = {row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'Entries'"
+        )}
+        conn.close()
+        self.assertIn("idx_entries_head", indexes)
+        self.assertIn("idx_entries_head_norm", indexes)
+    
+    def test_read_only_database_skips_migration(self):
+        """Test that lookups still work when the database cannot be migrated."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        readonly = sqlite3.OperationalError("attempt to write a readonly database")
+        with patch('logeion._migrate', side_effect=readonly):
+            exact = asyncio.run(get_word("amare"))
+            prefix = asyncio.run(get_word_prefix("pue"))
+        
+        self.assertEqual(exact.method, "exact_match")
+        self.assertTrue(prefix.success)
+        self.assertEqual(sorted(row["head"] for row in prefix.results), ["puella", "puer"])
+        conn = sqlite3.connect(self.temp_db.name)
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+        conn.close()
+        self.assertNotIn("Entries_fts", tables)
+    
+    def test_locked_database_is_not_served_unmigrated(self):
+        """Test that a lock held during migration fails the call instead of skipping."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        locked = sqlite3.OperationalError("database is locked")
+        with patch('logeion._migrate', side_effect=locked):
+            result = asyncio.run(get_word("amare"))
+        
+        self.assertEqual(result.method, "error")
+        self.assertNotIn(self.temp_db.name, sys.modules['logeion']._entry_columns)
+        
+        # Once the lock is gone the next call migrates and succeeds
+        self.assertEqual(asyncio.run(get_word("Cura")).method, "normalized")
+        self.assertIn("head_norm", sys.modules['logeion']._schema_features[self.temp_db.name])
+    
     def test_explore_database(self):
         """Test database exploration functionality."""
         # Temporarily set the database path to our test database
         sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
         
-        result = explore_database("Entries", 5)
+        result = asyncio.run(explore_database("Entries", 5))
         
         self.assertTrue(result["success"])
         self.assertEqual(result["table"], "Entries")
@@ -174,17 +529,94 @@ class TestLogeionMCPServer(unittest.TestCase):
         self.assertIsNotNone(result["column_names"])
         self.assertIsNotNone(result["sample_data"])
         self.assertLessEqual(result["total_rows"], 5)
+        self.assertNotIn("head_norm", result["column_names"])
+        self.assertNotIn("head_norm", [column[1] for column in result["schema"]])
+    
+    def test_explore_database_limit_capped(self):
+        """Test that explore_database never returns an unbounded sample."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        with patch('logeion._MAX_EXPLORE_ROWS', 3):
+            capped = asyncio.run(explore_database("Entries", 1000))
+            negative = asyncio.run(explore_database("Entries", -1))
+        
+        self.assertEqual(capped["total_rows"], 3)
+        self.assertEqual(negative["total_rows"], 0)
     
     def test_explore_database_invalid_table(self):
         """Test database exploration with invalid table name."""
         # Temporarily set the database path to our test database
         sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
         
-        result = explore_database("InvalidTable")
+        result = asyncio.run(explore_database("InvalidTable"))
         
         self.assertFalse(result["success"])
         self.assertIsNotNone(result["error"])
     
+    def test_explore_database_rejects_sql(self):
+        """Test that table names are whitelisted rather than interpolated."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        result = asyncio.run(explore_database("Entries; DROP TABLE Entries"))
+        
+        self.assertFalse(result["success"])
+        self.assertIn("Unknown table", result["error"])
+        self.assertTrue(asyncio.run(get_word("amare")).success)
+    
+    def test_connection_is_read_only(self):
+        """Test that the shared connections refuse writes."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        # Look up on this thread; worker threads close their connections on exit
+        sys.modules['logeion']._lookup_word("amare")
+        conn = next(iter(sys.modules['logeion']._connections[self.temp_db.name]))
+        
+        with self.assertRaises(sqlite3.DatabaseError):
+            conn.execute("DELETE FROM Entries")
+        with self.assertRaises(sqlite3.DatabaseError):
+            conn.execute("PRAGMA journal_mode=DELETE")
+    
+    def test_read_only_connection_queries_full_text_index(self):
+        """Test that the authorizer still lets a new connection use FTS5."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        asyncio.run(get_word("amare"))
+        
+        # A connection opened after the database was prepared, as on a new worker thread
+        conn = sys.modules['logeion']._open_connection(self.temp_db.name)
+        try:
+            sys.modules['logeion']._restrict_to_reads(conn, self.temp_db.name)
+            rows = conn.execute(
+                "SELECT head FROM Entries_fts WHERE Entries_fts MATCH ?", ("puer",)
+            ).fetchall()
+        finally:
+            conn.close()
+        
+        self.assertEqual([row["head"] for row in rows], ["puer"])
+    
+    def test_reload_keeps_connections(self):
+        """Test that reloading the module reuses its connections and caches."""
+        import subprocess
+        
+        code = (
+            "import importlib, sys, logeion\n"
+            "logeion.DATABASE_PATH = sys.argv[1]\n"
+            "logeion._lookup_word('amare')\n"
+            "connections = logeion._connections[sys.argv[1]]\n"
+            "importlib.reload(logeion)\n"
+            "logeion.DATABASE_PATH = sys.argv[1]\n"
+            "logeion._lookup_word('puer')\n"
+            "print(logeion._connections[sys.argv[1]] is connections, len(connections))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code, self.temp_db.name],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout
+        
+        self.assertEqual(output.strip(), "True 1")
+    
     def test_word_search_result_schema(self):
         """Test that WordSearchResult follows the expected schema."""
         result = WordSearchResult(
@@ -204,6 +636,18 @@ class TestLogeionMCPServer(unittest.TestCase):
         self.assertEqual(parsed["word"], "test")
         self.assertEqual(parsed["method"], "exact_match")
     
+    def test_word_search_result_from_lookup_serializes(self):
+        """Test that results built on the lookup path serialize with defaults."""
+        sys.modules['logeion'].DATABASE_PATH = self.temp_db.name
+        
+        result = asyncio.run(get_word("puer"))
+        parsed = json.loads(result.model_dump_json())
+        
+        self.assertTrue(parsed["success"])
+        self.assertIsNone(parsed["lemma"])
+        self.assertIsNone(parsed["error"])
+        self.assertEqual(parsed["results"][0]["head"], "puer")
+    
     def test_server_info_schema(self):
         """Test that ServerInfo follows the expected schema."""
         result = ServerInfo(
@@ -233,6 +677,21 @@ class TestLogeionMCPServer(unittest.TestCase):
 class TestPerformance(unittest.TestCase):
     """Performance tests for the MCP server."""
     
+    def test_import_does_not_load_spacy(self):
+        """Test that importing the server leaves spaCy unimported until needed."""
+        import subprocess
+        
+        code = "import sys, logeion; print('spacy' in sys.modules)"
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout
+        
+        self.assertEqual(output.strip(), "False")
+    
     def test_database_connection_performance(self):
         """Test database connection performance."""
         import time